@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import re
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Union
 
+from lxml import etree
+
 from lxml_extras.utils.enums import OnError
 from lxml_extras.utils.exceptions import (
     InvalidXpathAttributeError,
@@ -11,11 +16,110 @@ from lxml_extras.utils.exceptions import (
     NoXpathAttributesFoundError,
     XpathTooShortError,
 )
-from lxml_extras.utils.misc import is_numeric
+from lxml_extras.utils.misc import clamp_limit
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
     from lxml.etree import _Element, _ElementTree
 
+# interned so that the fast path checks below are mostly identity comparisons
+_XP_LINKS = sys.intern("//a/@href")
+_XP_IMGS = sys.intern("//img/@src")
+# xpaths of the form //tag/@attribute, which can be evaluated lazily
+_RE_TAG_ATTRIBUTE_XPATH = re.compile(r"//([\w-]+)/@([\w-]+)")
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """Compile an xpath expression once and reuse it on subsequent calls.
+
+    :param xpath: The xpath expression to compile.
+    :type xpath: str
+    :return: The compiled xpath evaluator.
+    :rtype: etree.XPath
+    :raises etree.XPathSyntaxError: If the xpath cannot be compiled.
+    """
+    return etree.XPath(xpath)
+
+
+# warm the cache with the default xpaths used by the extractors
+for _xpath in (_XP_LINKS, _XP_IMGS):
+    _compile_xpath(_xpath)
+del _xpath
+
+
+def _get_document(tree: Union[_Element, _ElementTree]) -> _ElementTree:
+    """Get the document of an lxml element or tree.
+
+    Like ``//`` in an xpath, tag iteration then covers the whole document rather
+    than only the subtree of the given element.
+
+    :param tree: The lxml element or tree to get the document of.
+    :type tree: Union[_Element, _ElementTree]
+    :return: The tree of the whole document.
+    :rtype: _ElementTree
+    """
+    return tree.getroottree() if hasattr(tree, "getroottree") else tree
+
+
+def _iter_tag_attribute(
+    tree: Union[_Element, _ElementTree],
+    tag: str,
+    attribute: str,
+) -> Iterator[str]:
+    """Lazily iterate over an attribute of every tag in the document of a tree.
+
+    This is equivalent to the xpath ``//tag/@attribute``, without having to build
+    the full result set when only the first few values are needed.
+
+    :param tree: The lxml element or tree whose document to iterate over.
+    :type tree: Union[_Element, _ElementTree]
+    :param tag: The tag of the elements to select.
+    :type tag: str
+    :param attribute: The attribute to get from the selected elements.
+    :type attribute: str
+    :return: An iterator over the attribute values, in document order.
+    :rtype: Iterator[str]
+    """
+    for element in _get_document(tree).iter(tag):
+        value = element.get(attribute)
+        if value is not None:
+            yield value
+
+
+def _extract_tag_attribute(
+    tree: Union[_Element, _ElementTree],
+    tag: str,
+    attribute: str,
+    *,
+    errors: Union[OnError, str] = "raise",
+    limit: Optional[int] = None,
+) -> Optional[list[str]]:
+    """Extract an attribute of every tag in a tree's document, like ``//tag/@attr``.
+
+    :param tree: The lxml element or tree to extract attributes from.
+    :type tree: Union[_Element, _ElementTree]
+    :param tag: The tag of the elements to select.
+    :type tag: str
+    :param attribute: The attribute to get from the selected elements.
+    :type attribute: str
+    :param errors: The error handling behavior. Defaults to "raise".
+    :type errors: Union[OnError, str]
+    :param limit: The maximum number of attributes to extract. Defaults to None.
+    :type limit: Optional[int]
+    :return: The list of extracted attributes, or None if no attributes found.
+    :rtype: Optional[list[str]]
+    :raises NoXpathAttributesFoundError: If no attributes are found.
+    """
+    errors = OnError.from_any(errors)
+    attributes = list(_iter_tag_attribute(tree, tag, attribute))
+    if not attributes:
+        if errors is OnError.RAISE:
+            raise NoXpathAttributesFoundError
+        return None
+    return attributes[: clamp_limit(limit, len(attributes))]
+
 
 def extract_attributes(
     tree: Union[_Element, _ElementTree],
@@ -48,56 +152,104 @@ def extract_attributes(
     ['link1', 'link2']
     """
     errors = OnError.from_any(errors)
+    attributes = _select_attributes(tree, xpath, errors=errors)
+    if attributes is None:
+        return None
+
+    if not attributes:
+        if errors is OnError.RAISE:
+            raise NoXpathAttributesFoundError
+        return None
+
+    return attributes[: clamp_limit(limit, len(attributes))]
+
+
+def iter_attributes(
+    tree: Union[_Element, _ElementTree],
+    xpath: str,
+    *,
+    errors: Union[OnError, str] = "raise",
+) -> Iterator[str]:
+    """Iterate over attributes from an lxml element or tree using an xpath.
+
+    Xpaths of the form ``//tag/@attribute`` are evaluated lazily, so consuming only
+    the first few attributes does not walk the whole document. Unlike
+    extract_attributes, finding no attributes is not an error.
+
+    :param tree: The lxml element or tree to iterate over attributes from.
+    :type tree: Union[_Element, _ElementTree]
+    :param xpath: The xpath expression to select the attributes.
+    :type xpath: str
+    :param errors: The error handling behavior. Defaults to "raise".
+    :type errors: Union[OnError, str]
+    :return: An iterator over the selected attributes.
+    :rtype: Iterator[str]
+    :raises XpathTooShortError: If the xpath is too short.
+    :raises InvalidXpathError: If the xpath is invalid.
+    :raises InvalidXpathAttributeError: If the xpath attribute is invalid.
+
+    >>> from lxml import etree
+    >>> html = '<root><a href="link1">Link 1</a><a href="link2">Link 2</a></root>'
+    >>> tree = etree.ElementTree(etree.fromstring(html))
+    >>> next(iter_attributes(tree, "//a/@href"))
+    'link1'
+    """
+    if match := _RE_TAG_ATTRIBUTE_XPATH.fullmatch(xpath):
+        return _iter_tag_attribute(tree, *match.groups())
+    attributes = _select_attributes(tree, xpath, errors=OnError.from_any(errors))
+    return iter(attributes or ())
+
+
+def _select_attributes(
+    tree: Union[_Element, _ElementTree],
+    xpath: str,
+    *,
+    errors: OnError,
+) -> Optional[list[str]]:
+    """Validate an attribute xpath and evaluate it against an lxml element or tree.
 
-    if (
-        not xpath
-        or not (xpath_parts := xpath.strip().split("/"))
-        or not (xpath_parts := ["/".join(xpath_parts[:-1]), xpath_parts[-1]])
-        or len(xpath_parts) <= 1
-        or not xpath_parts[-1]
-    ):
-        if errors == OnError.RAISE:
+    :param tree: The lxml element or tree to select attributes from.
+    :type tree: Union[_Element, _ElementTree]
+    :param xpath: The xpath expression to select the attributes.
+    :type xpath: str
+    :param errors: The error handling behavior.
+    :type errors: OnError
+    :return: The possibly empty list of selected attributes, or None on error.
+    :rtype: Optional[list[str]]
+    :raises XpathTooShortError: If the xpath is too short.
+    :raises InvalidXpathError: If the xpath is invalid.
+    :raises InvalidXpathAttributeError: If the xpath attribute is invalid.
+    """
+    xpath = xpath.strip() if xpath else ""
+    _, separator, xpath_attr = xpath.rpartition("/")
+    if not separator or not xpath_attr:
+        if errors is OnError.RAISE:
             raise XpathTooShortError
         return None
 
-    xpath_base = "/".join(xpath_parts[:-1])
-    xpath_attr = xpath_parts[-1]
-
-    # check if the attribute is text() or @attribute
-    if xpath_attr == "text()" or xpath_attr.startswith("@"):
-        try:
-            attributes = tree.xpath(f"{xpath_base}/{xpath_attr}")
-        except Exception as ex:
-            if errors == OnError.RAISE:
-                raise InvalidXpathError from ex
-            return None
-    else:
-        if errors == OnError.RAISE:
+    # check if the attribute is text() or @attribute before compiling anything
+    if xpath_attr != "text()" and not xpath_attr.startswith("@"):
+        if errors is OnError.RAISE:
             raise InvalidXpathAttributeError
         return None
 
-    if not attributes:
-        if errors == OnError.RAISE:
-            raise NoXpathAttributesFoundError
+    try:
+        # a compiled xpath always sees the whole document, whereas an ElementTree
+        # may be rooted at a subelement, which only its own xpath() method respects
+        root = tree.getroot() if hasattr(tree, "getroot") else None
+        if root is not None and root.getparent() is not None:
+            return tree.xpath(xpath)
+        return _compile_xpath(xpath)(tree)
+    except (etree.XPathError, ValueError) as ex:
+        # lxml rejects NUL, control and unencodable characters with a ValueError
+        if errors is OnError.RAISE:
+            raise InvalidXpathError from ex
         return None
 
-    limit = (
-        len(attributes)
-        if (
-            not limit
-            or not is_numeric(limit)
-            or (int_limit := int(float(limit))) <= 0
-            or int_limit > len(attributes)
-        )
-        else int(float(limit))
-    )
-
-    return list(attributes)[:limit]
-
 
 def extract_links(
     tree: Union[_Element, _ElementTree],
-    xpath: str = "//a/@href",
+    xpath: str = _XP_LINKS,
     *,
     errors: Union[OnError, str] = "raise",
     limit: Optional[int] = None,
@@ -125,6 +277,8 @@ def extract_links(
     >>> extract_links(tree)
     ['link1', 'link2']
     """
+    if xpath == _XP_LINKS:
+        return _extract_tag_attribute(tree, "a", "href", errors=errors, limit=limit)
     return extract_attributes(
         tree,
         xpath=xpath,
@@ -133,9 +287,38 @@ def extract_links(
     )
 
 
+def iter_links(
+    tree: Union[_Element, _ElementTree],
+    xpath: str = _XP_LINKS,
+    *,
+    errors: Union[OnError, str] = "raise",
+) -> Iterator[str]:
+    """Iterate over links from an lxml element or tree using an xpath.
+
+    :param tree: The lxml element or tree to iterate over links from.
+    :type tree: Union[_Element, _ElementTree]
+    :param xpath: The xpath expression to select the links. Defaults to "//a/@href".
+    :type xpath: str
+    :param errors: The error handling behavior. Defaults to "raise".
+    :type errors: Union[OnError, str]
+    :return: An iterator over the selected links.
+    :rtype: Iterator[str]
+    :raises XpathTooShortError: If the xpath is too short.
+    :raises InvalidXpathError: If the xpath is invalid.
+    :raises InvalidXpathAttributeError: If the xpath attribute is invalid.
+
+    >>> from lxml import etree
+    >>> html = '<root><a href="link1">Link 1</a><a href="link2">Link 2</a></root>'
+    >>> tree = etree.ElementTree(etree.fromstring(html))
+    >>> list(iter_links(tree))
+    ['link1', 'link2']
+    """
+    return iter_attributes(tree, xpath, errors=errors)
+
+
 def extract_images(
     tree: Union[_Element, _ElementTree],
-    xpath: str = "//img/@src",
+    xpath: str = _XP_IMGS,
     *,
     errors: Union[OnError, str] = "raise",
     limit: Optional[int] = None,
@@ -163,6 +346,8 @@ def extract_images(
     >>> extract_images(tree)
     ['image1.jpg', 'image2.jpg']
     """
+    if xpath == _XP_IMGS:
+        return _extract_tag_attribute(tree, "img", "src", errors=errors, limit=limit)
     return extract_attributes(
         tree,
         xpath=xpath,
@@ -171,9 +356,38 @@ def extract_images(
     )
 
 
+def iter_images(
+    tree: Union[_Element, _ElementTree],
+    xpath: str = _XP_IMGS,
+    *,
+    errors: Union[OnError, str] = "raise",
+) -> Iterator[str]:
+    """Iterate over images from an lxml element or tree using an xpath.
+
+    :param tree: The lxml element or tree to iterate over images from.
+    :type tree: Union[_Element, _ElementTree]
+    :param xpath: The xpath expression to select the images. Defaults to "//img/@src".
+    :type xpath: str
+    :param errors: The error handling behavior. Defaults to "raise".
+    :type errors: Union[OnError, str]
+    :return: An iterator over the selected images.
+    :rtype: Iterator[str]
+    :raises XpathTooShortError: If the xpath is too short.
+    :raises InvalidXpathError: If the xpath is invalid.
+    :raises InvalidXpathAttributeError: If the xpath attribute is invalid.
+
+    >>> from lxml import etree
+    >>> html = '<root><img src="image1.jpg"/><img src="image2.jpg"/></root>'
+    >>> tree = etree.ElementTree(etree.fromstring(html))
+    >>> list(iter_images(tree))
+    ['image1.jpg', 'image2.jpg']
+    """
+    return iter_attributes(tree, xpath, errors=errors)
+
+
 def extract_first_image(
     tree: Union[_Element, _ElementTree],
-    xpath: str = "//img/@src",
+    xpath: str = _XP_IMGS,
     *,
     errors: Union[OnError, str] = "raise",
 ) -> Optional[str]:
@@ -198,7 +412,106 @@ def extract_first_image(
     >>> extract_first_image(tree)
     'image1.jpg'
     """
-    images = extract_images(tree, xpath, errors=errors, limit=1)
-    if isinstance(images, list):
-        return images[0]
-    return images
+    errors = OnError.from_any(errors)
+    image = next(iter_images(tree, xpath, errors=errors), None)
+    if image is None and errors is OnError.RAISE:
+        raise NoXpathAttributesFoundError
+    return image
+
+
+def extract_first_link(
+    tree: Union[_Element, _ElementTree],
+    xpath: str = _XP_LINKS,
+    *,
+    errors: Union[OnError, str] = "raise",
+) -> Optional[str]:
+    """Extract the first link from an lxml element or tree using an xpath.
+
+    :param tree: The lxml element or tree to extract the first link from.
+    :type tree: Union[_Element, _ElementTree]
+    :param xpath: The xpath expression to select the links. Defaults to "//a/@href".
+    :type xpath: str
+    :param errors: The error handling behavior. Defaults to "raise".
+    :type errors: Union[OnError, str]
+    :return: The first extracted link, or None if no link found.
+    :rtype: Optional[str]
+    :raises XpathTooShortError: If the xpath is too short.
+    :raises InvalidXpathError: If the xpath is invalid.
+    :raises InvalidXpathAttributeError: If the xpath attribute is invalid.
+    :raises NoXpathAttributesFoundError: If no attributes are found.
+
+    >>> from lxml import etree
+    >>> html = '<root><a href="link1">Link 1</a><a href="link2">Link 2</a></root>'
+    >>> tree = etree.ElementTree(etree.fromstring(html))
+    >>> extract_first_link(tree)
+    'link1'
+    """
+    errors = OnError.from_any(errors)
+    link = next(iter_links(tree, xpath, errors=errors), None)
+    if link is None and errors is OnError.RAISE:
+        raise NoXpathAttributesFoundError
+    return link
+
+
+def extract_many(
+    tree: Union[_Element, _ElementTree],
+    xpaths: Mapping[str, str],
+    *,
+    errors: Union[OnError, str] = "raise",
+    limit: Optional[int] = None,
+) -> dict[str, Optional[list[str]]]:
+    """Extract attributes for several named xpaths from an lxml element or tree.
+
+    All xpaths of the form ``//tag/@attribute`` are served by a single walk over
+    the document, so extracting e.g. both links and images only visits each
+    element once. Other xpaths are evaluated as in extract_attributes.
+
+    :param tree: The lxml element or tree to extract attributes from.
+    :type tree: Union[_Element, _ElementTree]
+    :param xpaths: The xpath expressions to select the attributes, by name.
+    :type xpaths: Mapping[str, str]
+    :param errors: The error handling behavior. Defaults to "raise".
+    :type errors: Union[OnError, str]
+    :param limit: The maximum number of attributes to extract per xpath. Defaults to None.
+    :type limit: Optional[int]
+    :return: The lists of extracted attributes by name, with None for names where no attributes were found.
+    :rtype: dict[str, Optional[list[str]]]
+    :raises XpathTooShortError: If an xpath is too short.
+    :raises InvalidXpathError: If an xpath is invalid.
+    :raises InvalidXpathAttributeError: If an xpath attribute is invalid.
+    :raises NoXpathAttributesFoundError: If no attributes are found for an xpath.
+
+    >>> from lxml import etree
+    >>> html = '<root><a href="link1">Link 1</a><img src="image1.jpg"/></root>'
+    >>> tree = etree.ElementTree(etree.fromstring(html))
+    >>> extract_many(tree, {"links": "//a/@href", "images": "//img/@src"})
+    {'links': ['link1'], 'images': ['image1.jpg']}
+    """  # noqa: E501
+    errors = OnError.from_any(errors)
+
+    results: dict[str, Optional[list[str]]] = {}
+    # names and attributes to collect per tag during the single walk
+    tag_attributes: dict[str, list[tuple[str, str]]] = {}
+    for name, xpath in xpaths.items():
+        if match := _RE_TAG_ATTRIBUTE_XPATH.fullmatch(xpath):
+            tag, attribute = match.groups()
+            tag_attributes.setdefault(tag, []).append((name, attribute))
+            results[name] = []
+        else:
+            results[name] = _select_attributes(tree, xpath, errors=errors)
+
+    if tag_attributes:
+        for element in _get_document(tree).iter(*tag_attributes):
+            for name, attribute in tag_attributes[element.tag]:
+                value = element.get(attribute)
+                if value is not None:
+                    results[name].append(value)
+
+    for name, attributes in results.items():
+        if not attributes:
+            if errors is OnError.RAISE:
+                raise NoXpathAttributesFoundError
+            results[name] = None
+        else:
+            results[name] = attributes[: clamp_limit(limit, len(attributes))]
+    return results
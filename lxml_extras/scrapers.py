@@ -4,18 +4,48 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from lxml_extras.extractors import extract_images, extract_links
+from lxml_extras.extractors import (
+    extract_first_image,
+    extract_first_link,
+    extract_images,
+    extract_links,
+)
 from lxml_extras.utils.enums import OnError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping  # pragma: no cover
+    from collections.abc import Callable, Iterable, Mapping  # pragma: no cover
 
     from lxml.etree import _ElementTree
 
-from io import BytesIO
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import requests
 from lxml import etree
+from requests.adapters import HTTPAdapter
+
+# shared session so that connections are kept alive and pooled across requests
+_SESSION = requests.Session()
+for _prefix in ("https://", "http://"):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=32, pool_maxsize=32))
+del _prefix
+
+# lxml parsers must not be shared across threads, so each thread gets its own
+_LOCAL = threading.local()
+
+
+def _get_parser() -> etree.HTMLParser:
+    """Get the HTML parser of the current thread, creating it on first use."""
+    parser = getattr(_LOCAL, "parser", None)
+    if parser is None:
+        # drop whitespace-only text while parsing and skip building the id hash
+        parser = _LOCAL.parser = etree.HTMLParser(
+            remove_blank_text=True,
+            collect_ids=False,
+            no_network=True,
+        )
+    return parser
 
 
 def get_tree(
@@ -26,9 +56,16 @@ def get_tree(
     timeout: int = 60,
 ) -> _ElementTree:
     """Get the HTML tree from a URL using requests."""
-    response = requests.get(url, params=params, headers=headers, timeout=timeout)
-    parser = etree.HTMLParser()
-    return etree.parse(BytesIO(response.content), parser)  # noqa: S320
+    with _SESSION.get(
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout,
+        stream=True,
+    ) as response:
+        # let urllib3 undo any content encoding while lxml reads the body
+        response.raw.decode_content = True
+        return etree.parse(response.raw, _get_parser())  # noqa: S320
 
 
 def scrape_images(
@@ -40,13 +77,8 @@ def scrape_images(
     limit: Optional[int] = None,
 ) -> Optional[list[str]]:
     """Scrape images from a URL using an xpath."""
-    return extract_images(
-        get_tree(url),
-        xpath=xpath,
-        default=default,
-        errors=errors,
-        limit=limit,
-    )
+    images = extract_images(get_tree(url), xpath=xpath, errors=errors, limit=limit)
+    return default if images is None else images
 
 
 def scrape_first_image(
@@ -57,17 +89,8 @@ def scrape_first_image(
     errors: OnError = OnError.RAISE,
 ) -> Optional[str]:
     """Scrape the first image from a URL using an xpath."""
-    if not (
-        images := scrape_images(
-            url,
-            xpath=xpath,
-            default=default,
-            errors=errors,
-            limit=1,
-        )
-    ):
-        return default
-    return images[0]
+    image = extract_first_image(get_tree(url), xpath=xpath, errors=errors)
+    return default if image is None else image
 
 
 def scrape_links(
@@ -79,24 +102,71 @@ def scrape_links(
     limit: Optional[int] = None,
 ) -> Optional[list[str]]:
     """Scrape links from a URL using an xpath."""
-    return extract_links(
-        get_tree(url),
+    links = extract_links(get_tree(url), xpath=xpath, errors=errors, limit=limit)
+    return default if links is None else links
+
+
+def scrape_first_link(
+    url: str,
+    xpath: str = "//a/@href",
+    *,
+    default: Optional[str] = None,
+    errors: OnError = OnError.RAISE,
+) -> Optional[str]:
+    """Scrape the first link from a URL using an xpath."""
+    link = extract_first_link(get_tree(url), xpath=xpath, errors=errors)
+    return default if link is None else link
+
+
+def _scrape_many(
+    scrape: Callable[[str], Optional[list[str]]],
+    urls: Iterable[str],
+    max_workers: int,
+) -> list[Optional[list[str]]]:
+    """Run a single-URL scraper over many URLs concurrently, in the order of the URLs.
+
+    Threads are used rather than processes since this is IO bound: both requests
+    and the lxml parser release the GIL while waiting on sockets and parsing.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(scrape, urls))
+
+
+def scrape_images_many(  # noqa: PLR0913
+    urls: Iterable[str],
+    xpath: str = "//img/@src",
+    *,
+    default: Optional[str] = None,
+    errors: OnError = OnError.RAISE,
+    limit: Optional[int] = None,
+    max_workers: int = 16,
+) -> list[Optional[list[str]]]:
+    """Scrape images from many URLs concurrently, in the order of the URLs."""
+    scrape = partial(
+        scrape_images,
         xpath=xpath,
         default=default,
         errors=errors,
         limit=limit,
     )
+    return _scrape_many(scrape, urls, max_workers)
 
 
-def scrape_first_link(
-    url: str,
+def scrape_links_many(  # noqa: PLR0913
+    urls: Iterable[str],
     xpath: str = "//a/@href",
     *,
     default: Optional[str] = None,
     errors: OnError = OnError.RAISE,
-) -> Optional[str]:
-    """Scrape the first link from a URL using an xpath."""
-    links = scrape_links(url, xpath=xpath, default=default, errors=errors, limit=1)
-    if not links:
-        return default
-    return links[0]
+    limit: Optional[int] = None,
+    max_workers: int = 16,
+) -> list[Optional[list[str]]]:
+    """Scrape links from many URLs concurrently, in the order of the URLs."""
+    scrape = partial(
+        scrape_links,
+        xpath=xpath,
+        default=default,
+        errors=errors,
+        limit=limit,
+    )
+    return _scrape_many(scrape, urls, max_workers)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import re
+from html import escape
 from typing import TYPE_CHECKING, Optional, Union
 
-from lxml import html
+from lxml import etree
 
 from lxml_extras.utils.enums import OnError
 from lxml_extras.utils.exceptions import StringifyError
@@ -13,6 +14,13 @@ from lxml_extras.utils.exceptions import StringifyError
 if TYPE_CHECKING:
     from lxml.etree import _Element, _ElementTree  # pragma: no cover
 
+_RE_NEWLINE = re.compile(r"[\n\r]")
+# elements (including the context node) whose .text is whitespace only
+_BLANK_TEXT_XPATH = etree.XPath(
+    "descendant-or-self::*"
+    "[text()[1][not(preceding-sibling::node())][normalize-space() = '']]",
+)
+
 
 def to_string(
     node: Union[_Element, _ElementTree],
@@ -42,21 +50,49 @@ def to_string(
     '<a href="link1">Link 1</a><a href="link2">Link 2</a>'
     """  # noqa: E501
     errors = OnError.from_any(errors)
-    if node is None or (len(node) == 0 and not getattr(node, "text", None)):
-        if errors == OnError.RAISE:
+    if hasattr(node, "getroot"):
+        # an ElementTree is stringified through its root element
+        node = node.getroot()
+    try:
+        # .text first, so that sized non-nodes such as strings fail the probe too
+        empty = not node.text and len(node) == 0
+    except (TypeError, AttributeError):
+        # not something that can be stringified, e.g. None
+        empty = True
+    if empty:
+        if errors is OnError.RAISE:
             raise StringifyError
         return default
+    return _stringify(node, exclude_own_tag=exclude_own_tag)
+
+
+def _stringify(
+    node: Union[_Element, _ElementTree],
+    *,
+    exclude_own_tag: bool,
+) -> str:
+    """Clean up and serialize a non-empty lxml node or tree.
+
+    :param node: The lxml node or tree to convert.
+    :type node: Union[_Element, _ElementTree]
+    :param exclude_own_tag: If True, excludes the node's own tag from the output.
+    :type exclude_own_tag: bool
+    :return: The stringified node.
+    :rtype: str
+    """
     node.attrib.clear()
 
     node = remove_blank_node_text(node)
-    stringified = html.tostring(node).decode("utf-8")
-    for pattern, replace in {r"\n|\r": "", r">\s*": ">"}.items():
-        stringified = re.sub(pattern, replace, stringified)
+    node = collapse_node_whitespace(node)
     if exclude_own_tag:
-        opening_tag = len(node.tag) + 2
-        closing_tag = -(len(node.tag) + 3)
-        stringified = stringified[opening_tag:closing_tag]
-    return stringified
+        # escaped like the serializer escapes the text of the children
+        parts = [escape(node.text, quote=False) if node.text else ""]
+        parts.extend(
+            etree.tostring(child, method="html", encoding="unicode", with_tail=True)
+            for child in node
+        )
+        return "".join(parts)
+    return etree.tostring(node, method="html", encoding="unicode", with_tail=False)
 
 
 def remove_blank_node_text(
@@ -75,7 +111,34 @@ def remove_blank_node_text(
     >>> remove_blank_node_text(tree)
     <Element root at 0x7f7f7f7f7f7f>
     """
+    for element in _BLANK_TEXT_XPATH(node):
+        element.text = None
+    return node
+
+
+def collapse_node_whitespace(
+    node: Union[_Element, _ElementTree],
+) -> Union[_Element, _ElementTree]:
+    r"""Strip line breaks and leading whitespace from the text of an lxml node or tree.
+
+    The tail of the node itself is left untouched, as it is not part of the node,
+    and so is the text of comments and processing instructions.
+
+    :param node: The lxml node or tree in which to collapse whitespace.
+    :type node: Union[_Element, _ElementTree]
+    :return: The node or tree with its whitespace collapsed.
+    :rtype: Union[_Element, _ElementTree]
+
+    >>> from lxml import etree
+    >>> html = "<root>\n  <a>Link 1</a>\n  <a>Link 2</a>\n</root>"
+    >>> root = collapse_node_whitespace(etree.fromstring(html))
+    >>> etree.tostring(root)
+    b'<root><a>Link 1</a><a>Link 2</a></root>'
+    """
     for element in node.iter():
-        if element.text and element.text.strip() == "":
-            element.text = None
+        # comments and processing instructions have a callable tag
+        if element.text and isinstance(element.tag, str):
+            element.text = _RE_NEWLINE.sub("", element.text).lstrip() or None
+        if element.tail and element is not node:
+            element.tail = _RE_NEWLINE.sub("", element.tail).lstrip() or None
     return node
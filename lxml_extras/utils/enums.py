@@ -23,9 +23,22 @@ class OnError(Enum):
 
     def to_str(self) -> str:
         """Convert an OnError enum to a string."""
-        return self.name.lower()
+        return _TO_STR[self]
 
     @classmethod
     def from_any(cls, value: str | OnError) -> OnError:
         """Convert a string or OnError enum to an OnError enum."""
-        return cls.from_str(value) if isinstance(value, str) else value
+        try:
+            return _FROM_ANY[value]
+        except (KeyError, TypeError):
+            return cls.from_str(value) if isinstance(value, str) else value
+
+
+_TO_STR = {member: member.name.lower() for member in OnError}
+
+# members and their exact-case names for from_any, other strings go to from_str
+_FROM_ANY = {
+    **{member: member for member in OnError},
+    **{member.name: member for member in OnError},
+    **{name: member for member, name in _TO_STR.items()},
+}
@@ -2,68 +2,71 @@
 
 from __future__ import annotations
 
+import sys
+from typing import Final, Optional
 
-class XpathTooShortError(ValueError):
-    """Raised when an xpath is too short."""
+_XPATH_TOO_SHORT_MSG: Final[str] = sys.intern(
+    "Invalid xpath: must have at least two valid parts",
+)
+_INVALID_XPATH_ATTRIBUTE_MSG: Final[str] = sys.intern(
+    "Invalid xpath: attribute must be text() or @attribute",
+)
+_NO_XPATH_ATTRIBUTES_FOUND_MSG: Final[str] = sys.intern("No attributes found")
+_INVALID_XPATH_MSG: Final[str] = sys.intern("Invalid xpath")
+_STRINGIFY_MSG: Final[str] = sys.intern("Cannot stringify object")
+_INVALID_ON_ERROR_VALUE_MSG: Final[str] = sys.intern("Invalid value for OnError")
+
+
+class _DefaultMsgError(ValueError):
+    """Base for exceptions that fall back to a class-level default message."""
+
+    # BaseException already provides __dict__, this only drops __weakref__
+    __slots__ = ()
 
-    def __init__(
-        self: XpathTooShortError,
-        message: str = "Invalid xpath: must have at least two valid parts",
-    ) -> None:
+    default_message: str = ""
+
+    def __init__(self, message: Optional[str] = None) -> None:
         """Initialize the exception."""
-        super().__init__(message)
+        super().__init__(self.default_message if message is None else message)
+
+
+class XpathTooShortError(_DefaultMsgError):
+    """Raised when an xpath is too short."""
+
+    __slots__ = ()
+    default_message = _XPATH_TOO_SHORT_MSG
 
 
-class InvalidXpathAttributeError(ValueError):
+class InvalidXpathAttributeError(_DefaultMsgError):
     """Raised when an attribute is invalid."""
 
-    def __init__(
-        self: InvalidXpathAttributeError,
-        message: str = "Invalid xpath: attribute must be text() or @attribute",
-    ) -> None:
-        """Initialize the exception."""
-        super().__init__(message)
+    __slots__ = ()
+    default_message = _INVALID_XPATH_ATTRIBUTE_MSG
 
 
-class NoXpathAttributesFoundError(ValueError):
+class NoXpathAttributesFoundError(_DefaultMsgError):
     """Raised when no attributes are found."""
 
-    def __init__(
-        self: NoXpathAttributesFoundError,
-        message: str = "No attributes found",
-    ) -> None:
-        """Initialize the exception."""
-        super().__init__(message)
+    __slots__ = ()
+    default_message = _NO_XPATH_ATTRIBUTES_FOUND_MSG
 
 
-class InvalidXpathError(ValueError):
+class InvalidXpathError(_DefaultMsgError):
     """Raised when an xpath is invalid."""
 
-    def __init__(
-        self: InvalidXpathError,
-        message: str = "Invalid xpath",
-    ) -> None:
-        """Initialize the exception."""
-        super().__init__(message)
+    __slots__ = ()
+    default_message = _INVALID_XPATH_MSG
 
 
-class StringifyError(ValueError):
+class StringifyError(_DefaultMsgError):
     """Raised when an object cannot be stringified."""
 
-    def __init__(
-        self: StringifyError,
-        message: str = "Cannot stringify object",
-    ) -> None:
-        """Initialize the exception."""
-        super().__init__(message)
+    __slots__ = ()
+    default_message = _STRINGIFY_MSG
 
 
-class InvalidOnErrorValueError(ValueError):
+class InvalidOnErrorValueError(_DefaultMsgError):
     """Raised when an invalid value is passed to OnError.from_str."""
 
-    def __init__(
-        self: InvalidOnErrorValueError,
-        message: str = "Invalid value for OnError",
-    ) -> None:
-        """Initialize the exception."""
-        super().__init__(message)
+    __slots__ = ()
+    default_message = _INVALID_ON_ERROR_VALUE_MSG
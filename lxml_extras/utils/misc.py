@@ -1,10 +1,36 @@
 """Miscellaneous utility functions."""
 
+import math
+import re
+from collections.abc import Iterable
+from typing import Optional
+
+# decimal or scientific notation with an optional sign, e.g. "-1", ".5", "1.0e+01"
+_RE_NUMERIC = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+# bound once, as the attribute lookup is a noticeable part of a single check
+_match_numeric = _RE_NUMERIC.fullmatch
+
 
 def is_numeric(value: str) -> bool:
     """Check if a value is numeric."""
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return _match_numeric(str(value)) is not None
+
+
+def is_numeric_many(values: Iterable[str]) -> list[bool]:
+    """Check if each of many values is numeric, in the order of the values."""
+    return list(map(is_numeric, values))
+
+
+def clamp_limit(limit: Optional[int], length: int) -> int:
+    """Clamp a limit to a sequence length, falling back to the full length."""
+    if not limit:
+        return length
     try:
-        int(float(value))
-    except ValueError:
-        return False
-    return True
+        int_limit = int(float(limit))
+    except (TypeError, ValueError, OverflowError):
+        return length
+    return length if int_limit <= 0 or int_limit > length else int_limit
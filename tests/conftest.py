@@ -0,0 +1,134 @@
+"""Shared fixtures for the lxml_extras tests.
+
+The parsed trees are shared across the whole session, so tests must not modify
+them (the extractors never do, unlike to_string).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from lxml import etree
+
+if TYPE_CHECKING:
+    from lxml.etree import HTMLParser, _Element
+
+LINKS_MARKUP = """
+<html>
+    <body>
+        <a href="https://example.com">Example</a>
+        <a href="https://example.org">Example</a>
+        <a href="https://example.net">Example</a>
+    </body>
+</html>
+"""
+
+IMAGES_MARKUP = """
+<html>
+    <body>
+        <img src="https://example.com/image1.jpg" />
+        <img src="https://example.org/image2.jpg" />
+        <img src="https://example.net/image3.jpg" />
+    </body>
+</html>
+"""
+
+MIXED_MARKUP_IMAGE_FIRST = """
+<html>
+    <body>
+        <img src="https://example.com/image1.jpg" />
+        <a href="https://example.org">Example</a>
+        <a href="https://example.net">Example</a>
+    </body>
+</html>
+"""
+
+MIXED_MARKUP_IMAGE_SECOND = """
+<html>
+    <body>
+        <a href="https://example.com">Example</a>
+        <img src="https://example.org/image2.jpg" />
+        <a href="https://example.net">Example</a>
+    </body>
+</html>
+"""
+
+MIXED_MARKUP_IMAGE_THIRD = """
+<html>
+    <body>
+        <a href="https://example.com">Example</a>
+        <a href="https://example.org">Example</a>
+        <img src="https://example.net/image3.jpg" />
+    </body>
+</html>
+"""
+
+MIXED_MARKUP_MISSING_HREF = """
+<html>
+    <body>
+        <img src="https://example.com/image1.jpg" />
+        <a>Example</a>
+        <a href="https://example.org">Example</a>
+        <a href="https://example.net">Example</a>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture(scope="session")
+def html_parser() -> HTMLParser:
+    """Build the HTML parser shared by the tests.
+
+    The test documents are tiny and local, so skip the id hash and network access.
+    """
+    return etree.HTMLParser(
+        remove_blank_text=True,
+        collect_ids=False,
+        no_network=True,
+        huge_tree=False,
+        recover=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def links_tree(html_parser: HTMLParser) -> _Element:
+    """Parse a document with three links and no images."""
+    return etree.HTML(LINKS_MARKUP, parser=html_parser)
+
+
+@pytest.fixture(scope="session")
+def images_tree(html_parser: HTMLParser) -> _Element:
+    """Parse a document with three images and no links."""
+    return etree.HTML(IMAGES_MARKUP, parser=html_parser)
+
+
+@pytest.fixture(scope="session")
+def mixed_tree_image_second(html_parser: HTMLParser) -> _Element:
+    """Parse a document with an image between two links."""
+    return etree.HTML(MIXED_MARKUP_IMAGE_SECOND, parser=html_parser)
+
+
+@pytest.fixture(scope="session")
+def mixed_tree_missing_href(html_parser: HTMLParser) -> _Element:
+    """Parse a document with an image, a link without href, then two links."""
+    return etree.HTML(MIXED_MARKUP_MISSING_HREF, parser=html_parser)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        (IMAGES_MARKUP, "https://example.com/image1.jpg"),
+        (MIXED_MARKUP_IMAGE_FIRST, "https://example.com/image1.jpg"),
+        (MIXED_MARKUP_IMAGE_SECOND, "https://example.org/image2.jpg"),
+        (MIXED_MARKUP_IMAGE_THIRD, "https://example.net/image3.jpg"),
+    ],
+    ids=["images", "image_first", "image_second", "image_third"],
+)
+def first_image_case(
+    request: pytest.FixtureRequest,
+    html_parser: HTMLParser,
+) -> tuple[_Element, str]:
+    """Parse a document containing images, paired with its first image."""
+    markup, expected = request.param
+    return etree.HTML(markup, parser=html_parser), expected
@@ -1,13 +1,23 @@
 """Tests for the lxml_extras.extractors module."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
-from lxml import html
+from lxml import etree
 
 from lxml_extras.extractors import (
+    _compile_xpath,
     extract_attributes,
     extract_first_image,
+    extract_first_link,
     extract_images,
     extract_links,
+    extract_many,
+    iter_attributes,
+    iter_images,
+    iter_links,
 )
 from lxml_extras.utils.enums import OnError
 from lxml_extras.utils.exceptions import (
@@ -17,231 +27,195 @@ from lxml_extras.utils.exceptions import (
     XpathTooShortError,
 )
 
+if TYPE_CHECKING:
+    from lxml.etree import _Element
 
-def test_extract_links() -> None:
+
+def test_extract_links(links_tree: _Element) -> None:
     """Test extract_links."""
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <a href="https://example.org">Example</a>
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
-    assert extract_links(tree) == [
+    assert extract_links(links_tree) == [
         "https://example.com",
         "https://example.org",
         "https://example.net",
     ]
-    assert extract_links(tree, limit=2) == [
+    assert extract_links(links_tree, limit=2) == [
         "https://example.com",
         "https://example.org",
     ]
 
 
-def test_extract_images() -> None:
+def test_extract_images(images_tree: _Element) -> None:
     """Test extract_images."""
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <img src="https://example.com/image1.jpg" />
-                <img src="https://example.org/image2.jpg" />
-                <img src="https://example.net/image3.jpg" />
-            </body>
-        </html>
-        """,
-    )
-    assert extract_images(tree) == [
+    assert extract_images(images_tree) == [
         "https://example.com/image1.jpg",
         "https://example.org/image2.jpg",
         "https://example.net/image3.jpg",
     ]
-    assert extract_images(tree, limit=2) == [
+    assert extract_images(images_tree, limit=2) == [
         "https://example.com/image1.jpg",
         "https://example.org/image2.jpg",
     ]
 
 
-def test_extract_first_image() -> None:
+def test_extract_first_image(first_image_case: tuple[_Element, str]) -> None:
     """Test extract_first_image."""
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <img src="https://example.com/image1.jpg" />
-                <img src="https://example.org/image2.jpg" />
-                <img src="https://example.net/image3.jpg" />
-            </body>
-        </html>
-        """,
-    )
-    assert extract_first_image(tree) == "https://example.com/image1.jpg"
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <a href="https://example.org">Example</a>
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
+    tree, expected = first_image_case
+    assert extract_first_image(tree) == expected
+
+
+def test_extract_first_image_missing(links_tree: _Element) -> None:
+    """Test extract_first_image without any images."""
+    with pytest.raises(NoXpathAttributesFoundError):
+        extract_first_image(links_tree)
+
+    assert extract_first_image(links_tree, errors=OnError.IGNORE) is None
+
+
+def test_extract_first_link(
+    images_tree: _Element,
+    mixed_tree_missing_href: _Element,
+) -> None:
+    """Test extract_first_link."""
+    tree = mixed_tree_missing_href
+    assert extract_first_link(tree) == "https://example.org"
+    assert extract_first_link(tree[0][1]) == "https://example.org"
+    assert extract_first_link(tree, "//a/text()") == "Example"
+
     with pytest.raises(NoXpathAttributesFoundError):
-        extract_first_image(tree)
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <img src="https://example.com/image1.jpg" />
-                <a href="https://example.org">Example</a>
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
-    assert extract_first_image(tree) == "https://example.com/image1.jpg"
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <img src="https://example.org/image2.jpg" />
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
-    assert extract_first_image(tree) == "https://example.org/image2.jpg"
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <a href="https://example.org">Example</a>
-                <img src="https://example.net/image3.jpg" />
-            </body>
-        </html>
-        """,
-    )
-    assert extract_first_image(tree) == "https://example.net/image3.jpg"
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <a href="https://example.org">Example</a>
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
-    assert extract_first_image(tree, errors=OnError.IGNORE) is None
-
-
-def test_extract_attributes() -> None:
+        extract_first_link(images_tree)
+
+    assert extract_first_link(images_tree, errors=OnError.IGNORE) is None
+
+
+def test_extract_attributes(links_tree: _Element, images_tree: _Element) -> None:
     """Test extract_attributes."""
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <a href="https://example.org">Example</a>
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
-    assert extract_attributes(tree, "//a/@href") == [
+    assert extract_attributes(links_tree, "//a/@href") == [
         "https://example.com",
         "https://example.org",
         "https://example.net",
     ]
-    assert extract_attributes(tree, "//a/@href", limit=2) == [
+    assert extract_attributes(links_tree, "//a/@href", limit=2) == [
         "https://example.com",
         "https://example.org",
     ]
 
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <img src="https://example.com/image1.jpg" />
-                <img src="https://example.org/image2.jpg" />
-                <img src="https://example.net/image3.jpg" />
-            </body>
-        </html>
-        """,
-    )
-    assert extract_attributes(tree, "//img/@src") == [
+    assert extract_attributes(images_tree, "//img/@src") == [
         "https://example.com/image1.jpg",
         "https://example.org/image2.jpg",
         "https://example.net/image3.jpg",
     ]
-    assert extract_attributes(tree, "//img/@src", limit=2) == [
-        "https://example.com/image1.jpg",
-        "https://example.org/image2.jpg",
-    ]
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <a href="https://example.com">Example</a>
-                <a href="https://example.org">Example</a>
-                <a href="https://example.net">Example</a>
-            </body>
-        </html>
-        """,
-    )
-    assert extract_attributes(tree, "//a/@href", limit=2) == [
-        "https://example.com",
-        "https://example.org",
-    ]
-
-    tree = html.fromstring(
-        """
-        <html>
-            <body>
-                <img src="https://example.com/image1.jpg" />
-                <img src="https://example.org/image2.jpg" />
-                <img src="https://example.net/image3.jpg" />
-            </body>
-        </html>
-        """,
-    )
-    assert extract_attributes(tree, "//img/@src", limit=2) == [
+    assert extract_attributes(images_tree, "//img/@src", limit=2) == [
         "https://example.com/image1.jpg",
         "https://example.org/image2.jpg",
     ]
 
     with pytest.raises(NoXpathAttributesFoundError):
-        extract_attributes(tree, "//a/@href", errors=OnError.RAISE)
+        extract_attributes(images_tree, "//a/@href", errors=OnError.RAISE)
 
-    assert extract_attributes(tree, "//a/@href", errors=OnError.IGNORE) is None
+    assert extract_attributes(images_tree, "//a/@href", errors=OnError.IGNORE) is None
 
     with pytest.raises(XpathTooShortError):
-        extract_attributes(tree, "", errors=OnError.RAISE)
+        extract_attributes(images_tree, "", errors=OnError.RAISE)
+
+    assert extract_attributes(images_tree, "", errors=OnError.IGNORE) is None
 
-    assert extract_attributes(tree, "", errors=OnError.IGNORE) is None
+    with pytest.raises(XpathTooShortError):
+        extract_attributes(images_tree, "a", errors=OnError.RAISE)
 
-    assert extract_attributes(tree, "a", errors=OnError.IGNORE) is None
+    assert extract_attributes(images_tree, "a", errors=OnError.IGNORE) is None
 
     with pytest.raises(InvalidXpathAttributeError):
-        extract_attributes(tree, "//a", errors="raise")
+        extract_attributes(images_tree, "//a", errors="raise")
 
-    assert extract_attributes(tree, "//img", errors="ignore") is None
+    assert extract_attributes(images_tree, "//img", errors="ignore") is None
 
     with pytest.raises(InvalidXpathError):
-        extract_attributes(tree, "//+q/@i", errors=OnError.RAISE)
+        extract_attributes(images_tree, "//+q/@i", errors=OnError.RAISE)
+
+    assert extract_attributes(images_tree, "//+q/@i", errors=OnError.IGNORE) is None
+
+    for xpath in ("//img\x00/@src", "//img\ud800/@src"):
+        with pytest.raises(InvalidXpathError):
+            extract_attributes(images_tree, xpath, errors=OnError.RAISE)
+
+        assert extract_attributes(images_tree, xpath, errors=OnError.IGNORE) is None
+
+
+def test_extract_many(mixed_tree_image_second: _Element) -> None:
+    """Test extract_many."""
+    tree = mixed_tree_image_second
+    xpaths = {
+        "links": "//a/@href",
+        "images": "//img/@src",
+        "texts": "//a/text()",
+    }
+    assert extract_many(tree, xpaths) == {
+        "links": ["https://example.com", "https://example.net"],
+        "images": ["https://example.org/image2.jpg"],
+        "texts": ["Example", "Example"],
+    }
+    assert extract_many(tree, xpaths, limit=1) == {
+        "links": ["https://example.com"],
+        "images": ["https://example.org/image2.jpg"],
+        "texts": ["Example"],
+    }
+
+    with pytest.raises(NoXpathAttributesFoundError):
+        extract_many(tree, {"links": "//a/@href", "classes": "//p/@class"})
+
+    assert extract_many(
+        tree,
+        {"links": "//a/@href", "classes": "//p/@class", "invalid": "//a"},
+        errors=OnError.IGNORE,
+    ) == {
+        "links": ["https://example.com", "https://example.net"],
+        "classes": None,
+        "invalid": None,
+    }
+
+
+def test_extract_attributes_document(links_tree: _Element) -> None:
+    """Test that a document ElementTree uses the cached compiled xpath."""
+    xpath = "//body/a/@href"
+    extract_attributes(links_tree.getroottree(), xpath)
+    hits = _compile_xpath.cache_info().hits
+    assert extract_attributes(links_tree.getroottree(), xpath) == [
+        "https://example.com",
+        "https://example.org",
+        "https://example.net",
+    ]
+    assert _compile_xpath.cache_info().hits == hits + 1
+
+
+def test_extract_attributes_subtree() -> None:
+    """Test that an ElementTree rooted at a subelement only sees that subtree."""
+    root = etree.fromstring('<r><a href="1"/><b><a href="2"/></b></r>')
+    tree = etree.ElementTree(root[1])
+    misses = _compile_xpath.cache_info().misses
+    assert extract_attributes(tree, "//b/a[1]/@href") == ["2"]
+    assert _compile_xpath.cache_info().misses == misses
+    assert extract_attributes(tree, "//a/@href") == ["2"]
+    assert extract_attributes(tree, "/b/a/@href") == ["2"]
+    assert extract_attributes(tree, "/r/b/a/@href", errors=OnError.IGNORE) is None
+    assert extract_links(tree) == ["2"]
+    assert list(iter_attributes(tree, "/b/a/@href")) == ["2"]
+    assert extract_many(tree, {"links": "//a/@href", "nested": "/b/a/@href"}) == {
+        "links": ["2"],
+        "nested": ["2"],
+    }
+
+
+def test_iter_attributes(mixed_tree_image_second: _Element) -> None:
+    """Test iter_attributes, iter_links and iter_images."""
+    tree = mixed_tree_image_second
+    links = iter_links(tree)
+    assert next(links) == "https://example.com"
+    assert list(links) == ["https://example.net"]
+    assert list(iter_images(tree)) == ["https://example.org/image2.jpg"]
+    assert list(iter_attributes(tree, "//body/a/text()")) == ["Example", "Example"]
+    assert list(iter_attributes(tree, "//p/@class")) == []
+
+    with pytest.raises(InvalidXpathAttributeError):
+        iter_attributes(tree, "//a")
 
-    assert extract_attributes(tree, "//+q/@i", errors=OnError.IGNORE) is None
+    assert list(iter_attributes(tree, "//+q/@i", errors=OnError.IGNORE)) == []
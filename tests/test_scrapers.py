@@ -0,0 +1,53 @@
+"""Tests for the lxml_extras.scrapers module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lxml_extras.scrapers import scrape_images_many, scrape_links_many
+from lxml_extras.utils.enums import OnError
+
+if TYPE_CHECKING:
+    import requests_mock
+
+_URLS = [f"https://example.com/{index}" for index in range(5)]
+
+
+def _register(requests_mock: requests_mock.Mocker, markup: str) -> None:
+    """Serve a page per URL, numbered after its position in _URLS."""
+    for index, url in enumerate(_URLS):
+        requests_mock.get(url, text=markup.format(index=index))
+
+
+def test_scrape_images_many(requests_mock: requests_mock.Mocker) -> None:
+    """Test scrape_images_many."""
+    _register(requests_mock, '<html><body><img src="image{index}.jpg"></body></html>')
+    assert scrape_images_many(_URLS) == [[f"image{i}.jpg"] for i in range(5)]
+    assert scrape_images_many(_URLS, max_workers=2) == [
+        [f"image{i}.jpg"] for i in range(5)
+    ]
+    assert (
+        scrape_images_many(
+            _URLS,
+            "img",
+            default="default",
+            errors=OnError.IGNORE,
+        )
+        == ["default"] * 5
+    )
+
+
+def test_scrape_links_many(requests_mock: requests_mock.Mocker) -> None:
+    """Test scrape_links_many."""
+    _register(requests_mock, '<html><body><a href="link{index}">x</a></body></html>')
+    assert scrape_links_many(_URLS) == [[f"link{i}"] for i in range(5)]
+    assert scrape_links_many(_URLS, max_workers=2) == [[f"link{i}"] for i in range(5)]
+    assert (
+        scrape_links_many(
+            _URLS,
+            "a",
+            default="default",
+            errors=OnError.IGNORE,
+        )
+        == ["default"] * 5
+    )
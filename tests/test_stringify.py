@@ -1,16 +1,26 @@
 """Tests for the lxml_extras.stringify module."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
 from lxml import etree
 
-from lxml_extras.stringify import to_string
+from lxml_extras.stringify import (
+    collapse_node_whitespace,
+    remove_blank_node_text,
+    to_string,
+)
 from lxml_extras.utils.enums import OnError
 from lxml_extras.utils.exceptions import StringifyError
 
+if TYPE_CHECKING:
+    from lxml.etree import HTMLParser
 
-def test_to_string() -> None:
+
+def test_to_string(html_parser: HTMLParser) -> None:
     """Test to_string."""
-    parser = etree.HTMLParser(remove_blank_text=True)
     tree = etree.HTML(
         """
         <html>
@@ -19,7 +29,7 @@ def test_to_string() -> None:
             </body>
         </html>
         """,
-        parser=parser,
+        parser=html_parser,
     )
     assert to_string(tree) == "<body><p>Example</p></body>"
     assert (
@@ -37,3 +47,45 @@ def test_to_string() -> None:
 
     assert to_string(None, errors=OnError.IGNORE) is None
     assert to_string(None, errors=OnError.IGNORE, default="default") == "default"
+    assert to_string("abc", errors="ignore", default="D") == "D"
+
+
+def test_to_string_with_tail(html_parser: HTMLParser) -> None:
+    """Test that to_string leaves out the node's own tail."""
+    tree = etree.HTML("<div><p>Example</p>tail</div>", parser=html_parser)
+    assert to_string(tree[0][0][0], exclude_own_tag=False) == "<p>Example</p>"
+    assert to_string(tree[0][0][0]) == "Example"
+
+
+def test_collapse_node_whitespace() -> None:
+    """Test collapse_node_whitespace."""
+    root = etree.fromstring("<div>\n  <p>\n x</p>\n  tail</div>")
+    collapse_node_whitespace(root)
+    assert etree.tostring(root) == b"<div><p>x</p>tail</div>"
+
+    root = etree.fromstring("<div><!-- c --><p>x</p></div>")
+    collapse_node_whitespace(root)
+    assert etree.tostring(root) == b"<div><!-- c --><p>x</p></div>"
+
+
+def test_remove_blank_node_text() -> None:
+    """Test remove_blank_node_text."""
+    root = etree.fromstring("<div>\n  <p>x</p> <b>\xa0</b></div>")
+    remove_blank_node_text(root)
+    assert root.text is None
+    assert root[0].tail == " "
+    assert root[1].text == "\xa0"
+
+
+def test_to_string_escapes_text() -> None:
+    """Test that to_string escapes the leading text as it does the children."""
+    root = etree.fromstring("<div>a &amp; b &lt;script&gt;<b>x &amp; y</b></div>")
+    assert to_string(root) == "a &amp; b &lt;script&gt;<b>x &amp; y</b>"
+
+
+def test_to_string_element_tree() -> None:
+    """Test to_string on an ElementTree."""
+    html = '<root><a href="link1">Link 1</a><a href="link2">Link 2</a></root>'
+    tree = etree.ElementTree(etree.fromstring(html))
+    assert to_string(tree) == '<a href="link1">Link 1</a><a href="link2">Link 2</a>'
+    assert to_string(etree.ElementTree(), errors="ignore", default="D") == "D"
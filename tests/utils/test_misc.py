@@ -1,33 +1,76 @@
 """Tests for the lxml_extras.utils.misc module."""
 
-from lxml_extras.utils.misc import is_numeric
+import pytest
 
+from lxml_extras.utils.misc import clamp_limit, is_numeric, is_numeric_many
 
-def test_is_numeric() -> None:
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (1, True),
+        (1.0, True),
+        ("1", True),
+        ("1.0", True),
+        ("1e0", True),
+        ("1e-0", True),
+        ("1e+0", True),
+        ("1.0e0", True),
+        ("1.0e-0", True),
+        ("1.0e+0", True),
+        ("1.0e1", True),
+        ("1.0e-1", True),
+        ("1.0e+1", True),
+        ("1.0e01", True),
+        ("1.0e-01", True),
+        ("1.0e+01", True),
+        (float("inf"), False),
+        (float("nan"), False),
+        ("a", False),
+        ("1a", False),
+        ("1.0a", False),
+        ("1ea", False),
+        ("1e-a", False),
+        ("1e+a", False),
+        ("1.0ea", False),
+        ("1.0e-a", False),
+        ("1.0e+a", False),
+    ],
+)
+def test_is_numeric(value: object, expected: bool) -> None:
     """Test is_numeric."""
-    assert is_numeric(1)
-    assert is_numeric(1.0)
-    assert is_numeric("1")
-    assert is_numeric("1.0")
-    assert is_numeric("1e0")
-    assert is_numeric("1e-0")
-    assert is_numeric("1e+0")
-    assert is_numeric("1.0e0")
-    assert is_numeric("1.0e-0")
-    assert is_numeric("1.0e+0")
-    assert is_numeric("1.0e1")
-    assert is_numeric("1.0e-1")
-    assert is_numeric("1.0e+1")
-    assert is_numeric("1.0e01")
-    assert is_numeric("1.0e-01")
-    assert is_numeric("1.0e+01")
-
-    assert not is_numeric("a")
-    assert not is_numeric("1a")
-    assert not is_numeric("1.0a")
-    assert not is_numeric("1ea")
-    assert not is_numeric("1e-a")
-    assert not is_numeric("1e+a")
-    assert not is_numeric("1.0ea")
-    assert not is_numeric("1.0e-a")
-    assert not is_numeric("1.0e+a")
+    assert is_numeric(value) is expected
+
+
+def test_is_numeric_many() -> None:
+    """Test is_numeric_many."""
+    assert is_numeric_many([1, "1.0", "1e-0", "a", "1.0e+a"]) == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert is_numeric_many([]) == []
+    values = [True, 10**400, 1.5, float("nan"), float("inf"), " 2 ", None]
+    assert is_numeric_many(values) == [is_numeric(value) for value in values]
+    assert is_numeric_many(values) == [True, True, True, False, False, True, False]
+
+
+@pytest.mark.parametrize(
+    ("limit", "length", "expected"),
+    [
+        (None, 3, 3),
+        (0, 3, 3),
+        (-1, 3, 3),
+        (4, 3, 3),
+        (2, 3, 2),
+        (2.5, 3, 2),
+        ("2", 3, 2),
+        ("a", 3, 3),
+        (float("inf"), 3, 3),
+    ],
+)
+def test_clamp_limit(limit: object, length: int, expected: int) -> None:
+    """Test clamp_limit."""
+    assert clamp_limit(limit, length) == expected